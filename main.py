@@ -2,6 +2,7 @@ import pygame
 import os
 import sys
 import math
+from itertools import repeat
 
 
 class VirtualJoystick:
@@ -128,6 +129,86 @@ class MobileButton:
         self.current_color = self.color
 
 
+class SpriteCache:
+    """Кеш попередньо повернутих варіантів спрайту"""
+
+    def __init__(self, surface, steps=36, scale=1.0):
+        self.steps = steps
+        self.step_angle = 2 * math.pi / steps
+
+        # Оптимізація: всі повороти будуються один раз при завантаженні
+        width, height = surface.get_size()
+        self.variants = []
+        for i in range(steps):
+            if i == 0 and scale == 1.0:
+                # Без повороту використовуємо оригінал, щоб не розмивати його
+                image = surface
+            else:
+                # Вісь Y на екрані направлена вниз, тому кут інвертується
+                degrees = -math.degrees(i * self.step_angle)
+                image = pygame.transform.rotozoom(surface, degrees, scale)
+
+            # Зміщення, щоб центр варіанту збігався з центром оригіналу
+            offset = ((width - image.get_width()) // 2,
+                      (height - image.get_height()) // 2)
+            self.variants.append((image, offset))
+
+    def get(self, angle):
+        """Повертає (спрайт, зміщення) для найближчого квантованого кута"""
+        index = int(round(angle / self.step_angle)) % self.steps
+        return self.variants[index]
+
+
+# Шари відображення (малюються від меншого до більшого)
+LAYER_BACKGROUND = 0
+LAYER_GHOSTS = 1
+LAYER_PLAYER = 2
+LAYER_BULLETS = 3
+LAYER_CONTROLS = 4
+LAYER_HUD = 5
+LAYER_OVERLAY = 6
+LAYER_COUNT = 7
+
+
+class RenderQueue:
+    """Черга відображення з групуванням за шарами"""
+
+    def __init__(self):
+        self.layers = [[] for _ in range(LAYER_COUNT)]
+        self.flushed = []
+
+    def submit(self, surface, dest, layer):
+        """Додає спрайт до черги на поточний кадр"""
+        self.layers[layer].append((surface, dest))
+
+    def submit_all(self, surface, dests, layer):
+        """Додає один спрайт у кількох позиціях без циклу в Python"""
+        self.layers[layer].extend(zip(repeat(surface), dests))
+
+    def flush(self, screen):
+        """Малює всі шари від нижнього до верхнього"""
+        try:
+            for entries in self.layers:
+                if entries:
+                    # Оптимізація: один виклик у C замість окремого blit для кожного спрайту
+                    screen.blits(entries, doreturn=False)
+        finally:
+            # Черга очищується навіть при помилці, щоб не малювати старі спрайти
+            self.flushed = self.layers
+            self.layers = [[] for _ in range(LAYER_COUNT)]
+
+    def get_dirty_rects(self, clip_rect):
+        """Повертає змінені прямокутники останнього кадру в межах clip_rect"""
+        # Оптимізація: прямокутники будуються лише на запит, а не щокадру
+        dirty_rects = []
+        for entries in self.flushed:
+            for surface, dest in entries:
+                rect = surface.get_rect(topleft=(dest[0], dest[1])).clip(clip_rect)
+                if rect.width and rect.height:
+                    dirty_rects.append(rect)
+        return dirty_rects
+
+
 class Game:
     def __init__(self):
         pygame.init()
@@ -153,6 +234,12 @@ class Game:
         # Завантаження та оптимізація ресурсів
         self.load_and_optimize_assets()
 
+        # Повернуті варіанти куль для стрільби в будь-якому напрямку
+        self.bullet_cache = SpriteCache(self.bullet)
+
+        # Черга відображення
+        self.render_queue = RenderQueue()
+
         # Мобільні елементи керування
         self.setup_mobile_controls()
 
@@ -289,6 +376,10 @@ class Game:
             self.walk_left.append(surf)
             self.walk_right.append(surf)
 
+        # Проста куля
+        self.bullet = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(self.bullet, (255, 0, 0), (4, 4), 4)
+
     def setup_mobile_controls(self):
         """Налаштування мобільних елементів керування"""
         # Лівий джойстик для руху
@@ -457,12 +548,18 @@ class Game:
                 speed_y = math.sin(angle) * 8
             else:
                 # Стандартний напрямок
+                angle = 0
                 speed_x = 8
                 speed_y = 0
 
+            # Куля повернута в напрямку польоту (без трансформацій під час гри)
+            # Хітбокс не залежить від кута, повернутий варіант лише для малювання
+            image, offset = self.bullet_cache.get(angle)
             bullet_rect = self.bullet.get_rect(center=(self.player_x + 30, self.player_y + 15))
             self.bullets.append({
                 'rect': bullet_rect,
+                'image': image,
+                'offset': offset,
                 'speed_x': speed_x,
                 'speed_y': speed_y
             })
@@ -543,24 +640,27 @@ class Game:
 
     def draw(self):
         """Відображення гри"""
+        queue = self.render_queue
+
         # Фон
-        self.screen.blit(self.bg, (self.bg_x, 0))
-        self.screen.blit(self.bg, (self.bg_x + self.screen_width, 0))
-        self.screen.blit(self.bg, (self.bg_x - self.screen_width, 0))
+        queue.submit(self.bg, (self.bg_x, 0), LAYER_BACKGROUND)
+        queue.submit(self.bg, (self.bg_x + self.screen_width, 0), LAYER_BACKGROUND)
+        queue.submit(self.bg, (self.bg_x - self.screen_width, 0), LAYER_BACKGROUND)
 
         # Привиди
-        for ghost in self.ghost_list_in_game:
-            self.screen.blit(self.ghost, ghost)
+        queue.submit_all(self.ghost, self.ghost_list_in_game, LAYER_GHOSTS)
 
         # Гравець
         if self.move_joystick.distance > 0.1 and math.cos(self.move_joystick.angle) < 0:
-            self.screen.blit(self.walk_left[self.player_anim_count], (self.player_x, self.player_y))
+            queue.submit(self.walk_left[self.player_anim_count], (self.player_x, self.player_y), LAYER_PLAYER)
         else:
-            self.screen.blit(self.walk_right[self.player_anim_count], (self.player_x, self.player_y))
+            queue.submit(self.walk_right[self.player_anim_count], (self.player_x, self.player_y), LAYER_PLAYER)
 
         # Кулі
         for bullet in self.bullets:
-            self.screen.blit(self.bullet, bullet['rect'])
+            rect = bullet['rect']
+            offset = bullet['offset']
+            queue.submit(bullet['image'], (rect.x + offset[0], rect.y + offset[1]), LAYER_BULLETS)
 
         # Мобільні елементи керування (напівпрозорі)
         control_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
@@ -574,33 +674,35 @@ class Game:
         self.pause_button.draw(control_surface)
         self.shoot_button.draw(control_surface)
 
+        # Накладання елементів керування
+        queue.submit(control_surface, (0, 0), LAYER_CONTROLS)
+
         # Написання на кнопках
         ammo_text = self.ui_font.render(f"Ammo: {self.bullets_left}", True, (255, 255, 255))
-        control_surface.blit(ammo_text, (self.screen_width // 2 - 50, 10))
+        queue.submit(ammo_text, (self.screen_width // 2 - 50, 10), LAYER_HUD)
 
         # Ghosts: текст
         ghosts_text = self.ui_font.render(f"Ghosts: {len(self.ghost_list_in_game)}", True, (255, 255, 255))
-        control_surface.blit(ghosts_text, (self.screen_width // 2 - 50, 40))
+        queue.submit(ghosts_text, (self.screen_width // 2 - 50, 40), LAYER_HUD)
 
         # FPS
         fps_text = self.ui_font.render(f"FPS: {int(self.clock.get_fps())}", True, (200, 200, 200))
-        control_surface.blit(fps_text, (10, self.screen_height - 30))
-
-        # Накладання елементів керування
-        self.screen.blit(control_surface, (0, 0))
+        queue.submit(fps_text, (10, self.screen_height - 30), LAYER_HUD)
 
         # Екран програшу
         if not self.gameplay:
             overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
+            queue.submit(overlay, (0, 0), LAYER_OVERLAY)
 
-            self.screen.blit(self.lose_label,
-                             (self.screen_width // 2 - self.lose_label.get_width() // 2,
-                              self.screen_height // 2 - 50))
-            self.screen.blit(self.restart_label,
-                             (self.screen_width // 2 - self.restart_label.get_width() // 2,
-                              self.screen_height // 2 + 20))
+            queue.submit(self.lose_label,
+                         (self.screen_width // 2 - self.lose_label.get_width() // 2,
+                          self.screen_height // 2 - 50),
+                         LAYER_OVERLAY)
+            queue.submit(self.restart_label,
+                         (self.screen_width // 2 - self.restart_label.get_width() // 2,
+                          self.screen_height // 2 + 20),
+                         LAYER_OVERLAY)
 
             # Статистика
             stats = [
@@ -611,9 +713,13 @@ class Game:
 
             for i, stat in enumerate(stats):
                 stat_text = self.ui_font.render(stat, True, (200, 200, 200))
-                self.screen.blit(stat_text,
-                                 (self.screen_width // 2 - stat_text.get_width() // 2,
-                                  self.screen_height // 2 + 60 + i * 30))
+                queue.submit(stat_text,
+                             (self.screen_width // 2 - stat_text.get_width() // 2,
+                              self.screen_height // 2 + 60 + i * 30),
+                             LAYER_OVERLAY)
+
+        # Оптимізація: один виклик Surface.blits на кожен шар
+        queue.flush(self.screen)
 
     def restart_game(self):
         """Перезапуск гри"""